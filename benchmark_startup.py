@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Measure time-to-first-window for each build variant
+
+Launches normally run with a warm file cache, so even the first one is
+not a cold start. For a true cold start, reboot (or drop the OS file
+cache) right before running with --runs 1.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from build_gui_executable import BUILD_PROFILES, executable_path
+
+
+def find_variants():
+    """Return (name, command) for every variant that is available to run."""
+    variants = [("python", [sys.executable, "file_traverser_gui_standalone.py"])]
+    
+    for profile in BUILD_PROFILES:
+        exe_path = executable_path(profile)
+        if exe_path.exists():
+            variants.append((profile, [str(exe_path.resolve())]))
+        else:
+            print(f"⚠️  Skipping {profile}: {exe_path} not found "
+                  f"(build it with: python build_gui_executable.py --profile {profile})")
+    
+    return variants
+
+
+def measure_startup(command, timeout=60):
+    """Launch the app once and return seconds until its first window is drawn."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        marker = Path(tmp_dir) / "first_window.txt"
+        env = dict(os.environ, FILEVEX_STARTUP_MARKER=str(marker))
+        
+        start = time.time()
+        subprocess.run(command, env=env, timeout=timeout, check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        
+        if not marker.exists():
+            raise RuntimeError("the application exited without drawing a window")
+        return float(marker.read_text()) - start
+
+
+def main():
+    """Main function to run the startup benchmark."""
+    parser = argparse.ArgumentParser(description="Measure FileTraverserGUI time-to-first-window")
+    parser.add_argument("--runs", type=int, default=5, help="launches per variant (default: 5)")
+    args = parser.parse_args()
+    
+    print("⏱️  Startup Benchmark (time to first window)")
+    print("=" * 60)
+    
+    results = []
+    for name, command in find_variants():
+        try:
+            # The first launch is reported separately, but the files it reads
+            # are usually still cached (e.g. just built), so it is not a cold start
+            times = [measure_startup(command) for _ in range(args.runs)]
+        except (OSError, RuntimeError, subprocess.SubprocessError) as e:
+            print(f"✗ {name}: {e}")
+            continue
+        results.append((name, times))
+    
+    print(f"\n{'Variant':<10} {'First':>8} {'Median':>8} {'Min':>8} {'Max':>8}")
+    print("-" * 46)
+    for name, times in results:
+        print(f"{name:<10} {times[0]:>7.2f}s {statistics.median(times):>7.2f}s "
+              f"{min(times):>7.2f}s {max(times):>7.2f}s")
+    print("\nFirst = first launch (warm cache). For a cold start, reboot or drop the "
+          "file cache first and run with --runs 1.")
+
+
+if __name__ == "__main__":
+    main()
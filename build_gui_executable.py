@@ -3,12 +3,51 @@
 Build a standalone Windows GUI executable
 """
 
+import argparse
 import subprocess
 import sys
 import os
 from pathlib import Path
 
 
+# Stdlib packages the app never imports. PyInstaller can still pull them in
+# through optional imports (shutil -> bz2/lzma/tarfile, etc.), so the lean
+# profile excludes them explicitly.
+EXCLUDED_MODULES = [
+    "asyncio", "bz2", "lzma", "tarfile", "email", "http", "html", "xml",
+    "xmlrpc", "sqlite3", "ssl", "unittest", "doctest", "pydoc", "pdb",
+    "multiprocessing", "lib2to3", "distutils", "curses", "test",
+    "tkinter.test", "tkinter.tix",
+]
+
+# Build profiles
+#   onefile: a single self-extracting executable, unpacked to a temp
+#            folder on every launch (easy to share, slow to start)
+#   onedir:  a folder with the executable next to its libraries, started
+#            in place with unused stdlib modules left out (fast to start)
+BUILD_PROFILES = {
+    "onefile": {
+        "mode": "--onefile",
+        "distpath": "dist_gui",
+        "excludes": [],
+    },
+    "onedir": {
+        "mode": "--onedir",
+        "distpath": "dist_gui_onedir",
+        "excludes": EXCLUDED_MODULES,
+    },
+}
+
+
+def executable_path(profile="onefile"):
+    """Return where the given build profile puts the executable."""
+    name = "FileTraverserGUI.exe" if sys.platform == "win32" else "FileTraverserGUI"
+    dist = Path(BUILD_PROFILES[profile]["distpath"])
+    if profile == "onedir":
+        return dist / "FileTraverserGUI" / name
+    return dist / name
+
+
 def install_pyinstaller():
     """Install PyInstaller if not already installed."""
     try:
@@ -26,8 +65,8 @@ def install_pyinstaller():
             return False
 
 
-def create_gui_executable():
-    """Create a standalone GUI executable."""
+def create_gui_executable(profile="onefile"):
+    """Create a standalone GUI executable using the given build profile."""
     
     if not install_pyinstaller():
         return False
@@ -39,21 +78,25 @@ def create_gui_executable():
         print(f"✗ Error: {gui_script} not found!")
         return False
     
-    print(f"Creating standalone GUI executable from: {gui_script}")
+    settings = BUILD_PROFILES[profile]
+    print(f"Creating standalone GUI executable ({profile}) from: {gui_script}")
     
     # PyInstaller command for GUI executable
     cmd = [
         "pyinstaller",
-        "--onefile",                    # Single executable file
+        settings["mode"],               # Single file or folder build
         "--windowed",                   # No console window (GUI only)
         "--name=FileTraverserGUI",      # Name of the executable
-        "--distpath=dist_gui",          # Output directory
+        f"--distpath={settings['distpath']}",  # Output directory
         "--clean",                      # Clean cache before building
         "--noconfirm",                  # Don't ask for confirmation
         "--add-data=icon.ico:." if Path("icon.ico").exists() else "",  # Add icon if exists
         str(gui_script)
     ]
     
+    # Leave out stdlib modules the app never uses
+    cmd[-1:-1] = [f"--exclude-module={module}" for module in settings["excludes"]]
+    
     # Remove empty strings from command
     cmd = [arg for arg in cmd if arg]
     
@@ -62,14 +105,18 @@ def create_gui_executable():
         print(f"Command: {' '.join(cmd)}")
         subprocess.check_call(cmd)
         
-        exe_path = current_dir / "dist_gui" / "FileTraverserGUI.exe"
+        exe_path = current_dir / executable_path(profile)
         
         if exe_path.exists():
             print("\n" + "="*60)
             print("🎉 SUCCESS! Standalone GUI executable created!")
             print("="*60)
             print(f"📁 Location: {exe_path}")
-            print(f"📏 Size: {exe_path.stat().st_size / (1024*1024):.1f} MB")
+            if profile == "onedir":
+                size = sum(f.stat().st_size for f in exe_path.parent.rglob("*") if f.is_file())
+                print(f"📏 Size: {size / (1024*1024):.1f} MB (whole folder)")
+            else:
+                print(f"📏 Size: {exe_path.stat().st_size / (1024*1024):.1f} MB")
             print("\n✅ This executable:")
             print("   • Works on ANY Windows computer")
             print("   • Does NOT require Python installation")
@@ -207,6 +254,18 @@ A beautiful, easy-to-use graphical application for copying files from folders an
 - **Checked**: See information about each file being copied
 - **Unchecked**: Only see summary information
 
+### Skip Unchanged Folders on Repeat Runs
+- **Checked**: Remembers the modification time of each folder and of its copy, so the next run skips folders that have not changed on either side (only used when preserving structure without overwriting). Files deleted from the destination are copied again
+- **Unchecked**: Every folder is scanned on every run
+
+### Keep Watching for Changes
+- **Checked**: After the first full copy, new and modified files keep being copied automatically until you click "Stop Watching". Outside Linux, changes to existing files can take up to a minute to be picked up
+- **Unchecked**: The application copies everything once and stops
+
+## Dry Run
+
+Click **Plan (Dry Run)** to see what a copy would do before running it. Nothing is copied; instead you get a summary of how many files would be copied, replaced, renamed (file_1.txt) or skipped and how much data that is, saved as a plan file. Click **Run Plan** and select that file to copy exactly those files later without scanning the source folder again. If a file name was taken in the destination in the meantime, flattened copies get the next free number (noted in the log) just like a normal copy.
+
 ## Examples
 
 ### Copy All Files to One Folder
@@ -234,6 +293,7 @@ Result: The folder structure will be maintained in the backup
 - **Application won't start**: Make sure you're running it on Windows
 - **Can't select folders**: Make sure the folders exist and you have permission to access them
 - **Files not copying**: Check that you have write permission to the destination folder
+- **Some files failed**: Busy or temporarily unreachable files are retried automatically. Files that still fail are listed in `filevex_failures.json` in the destination folder - click "Retry Failed" and select that report to copy only those files again
 
 ## Support
 
@@ -247,7 +307,7 @@ This is a standalone application that works on any Windows computer without requ
     return readme_path
 
 
-def create_complete_package():
+def create_complete_package(profile="onefile"):
     """Create a complete package with the GUI executable and all supporting files."""
     
     import zipfile
@@ -255,10 +315,17 @@ def create_complete_package():
     # Files to include in the package
     files_to_include = []
     
-    # Add the executable if it exists
-    exe_path = Path("dist_gui/FileTraverserGUI.exe")
+    # Add the executable if it exists (the whole folder for onedir builds)
+    exe_path = executable_path(profile)
     if exe_path.exists():
-        files_to_include.append(("dist_gui/FileTraverserGUI.exe", "FileTraverserGUI.exe"))
+        if profile == "onedir":
+            for file_path in exe_path.parent.rglob("*"):
+                if file_path.is_file():
+                    # Keep the executable at the top so Install_GUI.bat finds it
+                    archive_name = file_path.relative_to(exe_path.parent)
+                    files_to_include.append((str(file_path), str(archive_name)))
+        else:
+            files_to_include.append((str(exe_path), exe_path.name))
     
     # Add supporting files
     supporting_files = [
@@ -288,7 +355,12 @@ def create_complete_package():
 
 def main():
     """Main function to build the GUI executable."""
-    print("🔧 Building Standalone GUI Executable")
+    parser = argparse.ArgumentParser(description="Build the FileTraverserGUI executable")
+    parser.add_argument("--profile", choices=sorted(BUILD_PROFILES), default="onefile",
+                        help="onefile (single file, default) or onedir (faster startup)")
+    args = parser.parse_args()
+    
+    print(f"🔧 Building Standalone GUI Executable ({args.profile})")
     print("=" * 50)
     
     # Create icon
@@ -297,7 +369,7 @@ def main():
     
     # Create GUI executable
     print("\nCreating GUI executable...")
-    success = create_gui_executable()
+    success = create_gui_executable(args.profile)
     
     if success:
         print("\nCreating supporting files...")
@@ -305,7 +377,7 @@ def main():
         create_readme()
         
         print("\nCreating complete package...")
-        create_complete_package()
+        create_complete_package(args.profile)
         
         print("\n" + "="*60)
         print("🎉 GUI Application Build Complete!")
@@ -5,12 +5,624 @@ A complete GUI application for copying files from folders
 """
 
 import tkinter as tk
-from tkinter import ttk, filedialog, messagebox, scrolledtext
-import threading
+from tkinter import ttk, scrolledtext
 import sys
 import os
-from pathlib import Path
-import shutil
+import errno
+import stat
+import heapq
+import functools
+import itertools
+import time
+from collections import Counter
+
+# Only what is needed to put the window on screen is imported here. Dialogs,
+# threading, pathlib, shutil, json and the watch/report helpers are imported
+# where they are used, which keeps cold start (especially when frozen) fast.
+
+
+# Retry settings for copies that fail with a transient error
+MAX_COPY_ATTEMPTS = 5
+RETRY_BASE_DELAY = 0.5      # seconds before the first retry
+RETRY_MAX_DELAY = 30.0      # upper bound for the backoff delay
+
+# Name of the machine-readable report written to the destination folder
+FAILURE_REPORT_NAME = "filevex_failures.json"
+
+# Default name and format version of dry-run plan files
+PLAN_FILE_NAME = "filevex_plan.json"
+PLAN_VERSION = 1
+
+# errno values that usually clear up on their own (busy files, NAS hiccups,
+# stale network handles) and are worth retrying before giving up
+TRANSIENT_ERRNOS = {
+    getattr(errno, name)
+    for name in ("EBUSY", "EAGAIN", "EWOULDBLOCK", "EINTR", "ETIMEDOUT", "ESTALE",
+                 "EIO", "ECONNRESET", "ECONNABORTED", "ENETRESET", "ENETUNREACH",
+                 "EHOSTUNREACH")
+    if hasattr(errno, name)
+}
+
+# Windows error codes for sharing/lock violations and dropped network shares
+TRANSIENT_WINERRORS = {32, 33, 59, 64, 121}
+
+# Directory-mtime cache that lets repeat runs skip unchanged folders
+# Kept in its own folder so saving it does not move the destination root's mtime
+WALK_CACHE_NAME = os.path.join(".filevex", "walk_cache.json")
+WALK_CACHE_VERSION = 2
+RACY_MTIME_WINDOW = 2.0     # don't trust folders modified this recently (FAT rounds to 2s)
+
+# Large files are split into chunks copied in parallel with pread/pwrite
+LARGE_FILE_THRESHOLD = 256 * 1024 * 1024
+COPY_CHUNK_SIZE = 64 * 1024 * 1024
+COPY_WORKERS = 4
+COPY_BLOCK_SIZE = 1024 * 1024   # bytes per pread/pwrite call within a chunk
+
+# Watch mode settings
+WATCH_TICK = 0.5            # seconds between checks for new events
+WATCH_DEBOUNCE = 2.0        # quiet period before a batch of changes is copied
+WATCH_BATCH_SIZE = 500      # copy early once this many changes are pending
+WATCH_POLL_INTERVAL = 5.0   # seconds between rescans when polling
+WATCH_SWEEP_INTERVAL = 60.0 # seconds between full rescans that catch in-place edits
+
+
+def classify_error(error):
+    """Return "transient" for errors worth retrying, "permanent" otherwise."""
+    if getattr(error, "winerror", None) in TRANSIENT_WINERRORS:
+        return "transient"
+    if isinstance(error, (TimeoutError, InterruptedError, BlockingIOError)):
+        return "transient"
+    if isinstance(error, OSError) and error.errno in TRANSIENT_ERRNOS:
+        return "transient"
+    return "permanent"
+
+
+def retry_delay(attempt):
+    """Exponential backoff with jitter for the given (1-based) attempt."""
+    import random
+    
+    delay = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * (2 ** (attempt - 1)))
+    return delay * random.uniform(0.5, 1.0)
+
+
+class RetryQueue:
+    """Deferred queue of copies waiting out their backoff delay."""
+
+    def __init__(self):
+        self._heap = []
+        self._counter = itertools.count()
+
+    def __len__(self):
+        return len(self._heap)
+
+    def push(self, item, delay):
+        """Schedule an item to become due after the given delay."""
+        due = time.monotonic() + delay
+        heapq.heappush(self._heap, (due, next(self._counter), item))
+
+    def pop_due(self):
+        """Remove and return every item whose backoff has elapsed."""
+        now = time.monotonic()
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            due.append(heapq.heappop(self._heap)[2])
+        return due
+
+    def seconds_until_next(self):
+        """Seconds until the next item is due (0 if one is already due)."""
+        if not self._heap:
+            return None
+        return max(0.0, self._heap[0][0] - time.monotonic())
+
+
+def walk_tree(root, reuse=None, stat_files=False):
+    """Walk a directory tree depth-first, yielding (directory, mtime, dirs, files).
+    
+    reuse(directory, mtime) may return the subfolder names recorded for a
+    folder that does not need to be listed again; files is then None. Other
+    folders are listed with os.scandir. Symlinked directories are not
+    followed, matching os.walk.
+    
+    With stat_files, files maps each name to its (mtime_ns, size), or None
+    if it cannot be stat'ed. The stats come from the directory listing,
+    which costs nothing extra on Windows.
+    """
+    pending = [str(root)]
+    
+    while pending:
+        directory = pending.pop()
+        try:
+            mtime = os.stat(directory).st_mtime_ns
+        except OSError:
+            continue
+        
+        dirs = reuse(directory, mtime) if reuse else None
+        files = None
+        if dirs is None:
+            dirs, files = [], []
+            try:
+                with os.scandir(directory) as it:
+                    for item in it:
+                        if item.is_dir():
+                            if not item.is_symlink():
+                                dirs.append(item.name)
+                        elif stat_files:
+                            try:
+                                st = item.stat()
+                                files.append((item.name, (st.st_mtime_ns, st.st_size)))
+                            except OSError:
+                                files.append((item.name, None))
+                        else:
+                            files.append(item.name)
+            except OSError:
+                continue
+            dirs.sort()
+            files.sort()
+            if stat_files:
+                files = dict(files)
+        
+        yield directory, mtime, dirs, files
+        pending.extend(os.path.join(directory, name) for name in reversed(dirs))
+
+
+def scan_tree(root, previous=None, stat_files=False):
+    """Snapshot a directory tree as {directory: {"mtime", "dirs", "files"}}.
+    
+    Directories whose mtime matches the previous snapshot reuse its entry
+    instead of being listed again (unless its files are None, i.e. unknown).
+    stat_files is passed on to walk_tree.
+    """
+    previous = previous or {}
+    
+    def reuse(directory, mtime):
+        entry = previous.get(directory)
+        if entry is not None and entry["mtime"] == mtime and entry["files"] is not None:
+            return entry["dirs"]
+        return None
+    
+    snapshot = {}
+    for directory, mtime, dirs, files in walk_tree(root, reuse, stat_files):
+        if files is None:
+            snapshot[directory] = previous[directory]
+        else:
+            snapshot[directory] = {"mtime": mtime, "dirs": dirs, "files": files}
+    return snapshot
+
+
+def snapshot_files(snapshot):
+    """Yield the path of every file in a scan_tree snapshot."""
+    for directory, entry in snapshot.items():
+        for name in entry["files"]:
+            yield os.path.join(directory, name)
+
+
+def data_ranges(fd, size):
+    """Return the (start, end) byte ranges of a file that hold data.
+    
+    Holes in sparse files are found with SEEK_DATA/SEEK_HOLE. Where that is
+    not supported the whole file is treated as data.
+    """
+    if not hasattr(os, "SEEK_DATA"):
+        return [(0, size)] if size else []
+    
+    ranges = []
+    offset = 0
+    try:
+        while offset < size:
+            try:
+                start = os.lseek(fd, offset, os.SEEK_DATA)
+            except OSError as e:
+                if e.errno == errno.ENXIO:
+                    break   # only a hole is left
+                raise
+            end = min(os.lseek(fd, start, os.SEEK_HOLE), size)
+            ranges.append((start, end))
+            offset = end
+    except OSError:
+        return [(0, size)] if size else []
+    return ranges
+
+
+def copy_range(src_fd, dst_fd, start, end):
+    """Copy bytes [start, end) between two file descriptors with positional I/O."""
+    offset = start
+    while offset < end:
+        data = os.pread(src_fd, min(COPY_BLOCK_SIZE, end - offset), offset)
+        if not data:
+            raise OSError(errno.EIO, "source file shrank while it was being copied")
+        view = memoryview(data)
+        while view:
+            written = os.pwrite(dst_fd, view, offset)
+            offset += written
+            view = view[written:]
+    return end - start
+
+
+def preallocate(fd, ranges):
+    """Reserve disk space for the given byte ranges, where that is cheap.
+    
+    Uses the Linux fallocate(2) call, which fails on file systems that
+    cannot reserve space (NFSv3, many SMB mounts). posix_fallocate is not
+    used because glibc then falls back to writing every block, doubling the
+    I/O of a large copy. Elsewhere nothing is preallocated.
+    """
+    if not sys.platform.startswith("linux"):
+        return
+    
+    import ctypes
+    import ctypes.util
+    
+    libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+    fallocate = getattr(libc, "fallocate64", None) or libc.fallocate
+    fallocate.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.c_int64, ctypes.c_int64]
+    for start, end in ranges:
+        if fallocate(fd, 0, start, end - start) != 0:
+            return  # not supported here; the copy works without it
+
+
+def copy_large_file(src_fd, source_file, dest_file, progress=None):
+    """Copy a large file in parallel chunks, keeping holes in sparse files.
+    
+    The copy is written to a temporary name next to the destination, sized
+    up front (leaving holes unwritten) and its data ranges preallocated, so
+    workers can write their chunks in any order. Metadata is copied as
+    shutil.copy2 does, then the file is moved into place. A failed copy
+    removes the temporary file instead of leaving a full-size destination
+    that later runs would skip as existing.
+    
+    progress(done, total) is called in the calling thread after every chunk,
+    counting data bytes only (holes excluded).
+    """
+    import shutil
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+    
+    size = os.fstat(src_fd).st_size
+    ranges = data_ranges(src_fd, size)
+    total = sum(end - start for start, end in ranges)
+    chunks = [(offset, min(offset + COPY_CHUNK_SIZE, end))
+              for start, end in ranges
+              for offset in range(start, end, COPY_CHUNK_SIZE)]
+    
+    dest_dir, dest_name = os.path.split(os.fspath(dest_file))
+    tmp_file = os.path.join(dest_dir, f".{dest_name}.filevex-partial")
+    
+    dst_fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        try:
+            # Setting the size leaves unwritten ranges as holes
+            os.ftruncate(dst_fd, size)
+            preallocate(dst_fd, ranges)
+            
+            done = 0
+            with ThreadPoolExecutor(max_workers=COPY_WORKERS) as executor:
+                futures = [executor.submit(copy_range, src_fd, dst_fd, start, end)
+                           for start, end in chunks]
+                try:
+                    for future in as_completed(futures):
+                        done += future.result()
+                        if progress:
+                            progress(done, total)
+                except BaseException:
+                    for future in futures:
+                        future.cancel()
+                    raise
+        finally:
+            os.close(dst_fd)
+        
+        shutil.copystat(source_file, tmp_file)
+        os.replace(tmp_file, dest_file)
+    except BaseException:
+        try:
+            os.unlink(tmp_file)
+        except OSError:
+            pass
+        raise
+
+
+def walk_cache_key(source_path, dest_path, preserve_structure, overwrite):
+    """Describe the job a walk cache was built for; any change invalidates it."""
+    return {
+        "version": WALK_CACHE_VERSION,
+        "source_dir": os.path.abspath(source_path),
+        "dest_dir": os.path.abspath(dest_path),
+        "preserve_structure": preserve_structure,
+        "overwrite": overwrite,
+    }
+
+
+def load_walk_cache(dest_path, key):
+    """Return the cached directory entries for this job, or {} if unusable."""
+    import json
+    
+    try:
+        with open(os.path.join(dest_path, WALK_CACHE_NAME), encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("key") != key:
+        return {}
+    return data.get("dirs", {})
+
+
+def dest_folder_mtime(source_path, dest_path, directory):
+    """Return the mtime of the destination folder mirroring a source folder, or None."""
+    try:
+        return os.stat(os.path.join(dest_path, os.path.relpath(directory, source_path))).st_mtime_ns
+    except OSError:
+        return None
+
+
+def save_walk_cache(source_path, dest_path, key, dirs):
+    """Atomically write the walk cache next to the copied files.
+    
+    Folders listed in this run get the mtime of their destination folder
+    recorded here, after the job's last write to it, so deleting a copy
+    there later moves that mtime and the folder is listed again.
+    """
+    import json
+    
+    cache_path = os.path.join(dest_path, WALK_CACHE_NAME)
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    
+    for directory, entry in dirs.items():
+        if entry["complete"] and entry.get("dest_mtime") is None:
+            entry["dest_mtime"] = dest_folder_mtime(source_path, dest_path, directory)
+    
+    tmp_path = cache_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"key": key, "dirs": dirs}, f)
+    os.replace(tmp_path, cache_path)
+
+
+def walk_source(source_path, dest_path, cache=None, stat_files=False):
+    """Walk a source tree, skipping folders that are unchanged since the last run.
+    
+    Yields (directory, files, entry) for every directory. files is None when
+    the cache shows the folder was fully handled before and neither its
+    mtime nor that of its destination folder has changed since, in which
+    case it is not listed again. entry is the folder's new cache record:
+    its mtime, subfolder names, file count and destination folder mtime
+    (None until save_walk_cache records it). stat_files is passed on to
+    walk_tree.
+    """
+    cache = cache or {}
+    racy_after = time.time_ns() - int(RACY_MTIME_WINDOW * 1e9)
+    
+    def reuse(directory, mtime):
+        entry = cache.get(directory)
+        if (entry and entry.get("complete") and entry.get("mtime") == mtime
+                and entry.get("dest_mtime") is not None
+                and entry["dest_mtime"] == dest_folder_mtime(source_path, dest_path, directory)):
+            return entry["dirs"]
+        return None
+    
+    for directory, mtime, dirs, files in walk_tree(source_path, reuse, stat_files):
+        if files is None:
+            entry = dict(cache[directory])
+        else:
+            # A folder changed within the mtime granularity could change again
+            # without its mtime moving, so it is never marked complete
+            entry = {"mtime": mtime, "dirs": dirs, "files": len(files),
+                     "complete": mtime < racy_after, "dest_mtime": None}
+        yield directory, files, entry
+
+
+def format_size(num_bytes):
+    """Format a byte count for people, e.g. 1536 -> "1.5 KB"."""
+    size = float(num_bytes)
+    for unit in ("bytes", "KB", "MB", "GB", "TB"):
+        if size < 1024 or unit == "TB":
+            return f"{size:.0f} {unit}" if unit == "bytes" else f"{size:.1f} {unit}"
+        size /= 1024
+
+
+class DestinationModel:
+    """In-memory view of the destination folder used for dry runs.
+    
+    Starts from what is on disk (each folder is listed once, on first use)
+    and records the files a plan would create, so collision naming sees
+    them without anything being written.
+    """
+
+    def __init__(self):
+        self.planned = set()
+        self._listings = {}
+
+    def exists(self, path):
+        directory, name = os.path.split(os.path.normcase(str(path)))
+        if os.path.join(directory, name) in self.planned:
+            return True
+        
+        names = self._listings.get(directory)
+        if names is None:
+            try:
+                names = {os.path.normcase(entry) for entry in os.listdir(directory)}
+            except OSError:
+                names = set()
+            self._listings[directory] = names
+        return name in names
+
+    def add(self, path):
+        self.planned.add(os.path.normcase(str(path)))
+
+
+class PollingWatcher:
+    """Detect created and modified files by periodically rescanning the tree.
+    
+    Only directories whose mtime moved are listed again (see scan_tree),
+    with their file stats taken from the listing. Editing a file in place
+    does not touch the mtime of its directory, so every sweep_interval
+    seconds all directories are listed again to catch those edits.
+    
+    The first snapshot comes from the initial full pass (see prime).
+    Directories it has no file stats for are listed on the first poll, and
+    their files count as changed if modified since the watcher was created.
+    """
+
+    def __init__(self, root, interval=WATCH_POLL_INTERVAL, sweep_interval=WATCH_SWEEP_INTERVAL):
+        from pathlib import Path
+        
+        # Spelled like the paths recorded by the initial pass
+        self.root = str(Path(root))
+        self.interval = interval
+        self.sweep_interval = sweep_interval
+        self.snapshot = {}
+        # Allow for coarse file system timestamps (see RACY_MTIME_WINDOW)
+        self.started = time.time_ns() - int(RACY_MTIME_WINDOW * 1e9)
+        self.last_scan = self.last_sweep = time.monotonic()
+
+    def prime(self, snapshot):
+        """Take the folders listed by the initial full pass as the first snapshot.
+        
+        snapshot is in scan_tree's format with stat_files, where files is None
+        for folders the pass did not list.
+        """
+        self.snapshot = snapshot
+
+    def poll(self, timeout):
+        """Wait up to timeout seconds and return the set of changed file paths."""
+        time.sleep(timeout)
+        now = time.monotonic()
+        if now - self.last_scan < self.interval:
+            return set()
+        
+        previous = self.snapshot
+        sweep = now - self.last_sweep >= self.sweep_interval
+        self.snapshot = scan_tree(self.root, None if sweep else previous, stat_files=True)
+        self.last_scan = time.monotonic()
+        if sweep:
+            self.last_sweep = self.last_scan
+        
+        changed = set()
+        for directory, entry in self.snapshot.items():
+            old = previous.get(directory)
+            if entry is old:
+                continue
+            if old is not None:
+                old_files = old["files"]
+            elif previous:
+                old_files = {}      # created since the last scan
+            else:
+                old_files = None    # never primed, so nothing is known yet
+            
+            for name, sig in entry["files"].items():
+                if old_files is None:
+                    # Not listed before: only edits since watching began count
+                    if sig is not None and sig[0] >= self.started:
+                        changed.add(os.path.join(directory, name))
+                elif old_files.get(name) != sig:
+                    changed.add(os.path.join(directory, name))
+        return changed
+
+    def close(self):
+        pass
+
+
+class InotifyWatcher:
+    """Detect created and modified files with Linux inotify (via ctypes)."""
+
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    IN_ISDIR = 0x40000000
+    MASK = IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+
+    def __init__(self, root):
+        import ctypes
+        import ctypes.util
+        import struct
+        
+        self.root = str(root)
+        self.event = struct.Struct("iIII")
+        self._ctypes = ctypes
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self.fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+        
+        self.watches = {}
+        try:
+            self._watch_tree(self.root)
+        except OSError:
+            self.close()
+            raise
+
+    def _watch_tree(self, top):
+        """Watch a directory and everything below it, returning the files found."""
+        snapshot = scan_tree(top)
+        for directory in snapshot:
+            wd = self._libc.inotify_add_watch(self.fd, os.fsencode(directory), self.MASK)
+            if wd < 0:
+                err = self._ctypes.get_errno()
+                if err in (errno.ENOENT, errno.EACCES):
+                    continue
+                # ENOSPC here means fs.inotify.max_user_watches is exhausted
+                raise OSError(err, os.strerror(err), directory)
+            self.watches[wd] = directory
+        return set(snapshot_files(snapshot))
+
+    def poll(self, timeout):
+        """Wait up to timeout seconds and return the set of changed file paths."""
+        import select
+        
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        if not readable:
+            return set()
+        
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return set()
+        
+        changed = set()
+        offset = 0
+        while offset + self.event.size <= len(data):
+            wd, mask, _cookie, length = self.event.unpack_from(data, offset)
+            name = data[offset + self.event.size:offset + self.event.size + length].rstrip(b"\0")
+            offset += self.event.size + length
+            
+            if mask & self.IN_Q_OVERFLOW:
+                # Events were dropped; fall back to a full scan of the tree
+                changed |= set(snapshot_files(scan_tree(self.root)))
+                continue
+            if mask & self.IN_IGNORED:
+                self.watches.pop(wd, None)
+                continue
+            
+            directory = self.watches.get(wd)
+            if directory is None or not name:
+                continue
+            path = os.path.join(directory, os.fsdecode(name))
+            
+            if mask & self.IN_ISDIR:
+                if mask & (self.IN_CREATE | self.IN_MOVED_TO):
+                    # Files may have landed before the new watch was in place
+                    try:
+                        changed |= self._watch_tree(path)
+                    except OSError:
+                        changed |= set(snapshot_files(scan_tree(path)))
+            elif mask & (self.IN_CLOSE_WRITE | self.IN_MOVED_TO):
+                changed.add(path)
+        
+        return changed
+
+    def close(self):
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
+def create_watcher(root):
+    """Return an inotify watcher on Linux, or a polling watcher elsewhere."""
+    if sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(root)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(root)
 
 
 class FileTraverserGUI:
@@ -37,6 +649,20 @@ class FileTraverserGUI:
         self.copied_files = 0
         self.skipped_files = 0
         self.errors = 0
+        self.failures = []
+        self.last_report = None
+        
+        # Destinations held by deferred retries, so that another file
+        # cannot be given the same flattened name in the meantime
+        self.reserved_dests = set()
+        
+        self.walk_cache = tk.BooleanVar()
+        
+        # Watch mode state: source file -> destination it was mirrored to.
+        # Only kept while a watch job runs (None otherwise).
+        self.watch_mode = tk.BooleanVar()
+        self.mirror_map = None
+        self.stop_watching = None
         
         self.setup_ui()
         
@@ -120,13 +746,21 @@ class FileTraverserGUI:
         ttk.Checkbutton(options_frame, text="📝 Show detailed output", 
                        variable=self.verbose,
                        command=self.on_option_change).grid(row=2, column=0, sticky=tk.W, pady=5)
+        
+        ttk.Checkbutton(options_frame, text="👁️ Keep watching for changes after copying", 
+                       variable=self.watch_mode,
+                       command=self.on_option_change).grid(row=3, column=0, sticky=tk.W, pady=5)
+        
+        ttk.Checkbutton(options_frame, text="⚡ Skip unchanged folders on repeat runs", 
+                       variable=self.walk_cache,
+                       command=self.on_option_change).grid(row=4, column=0, sticky=tk.W, pady=5)
 
 
     
         
         # Info labels
         self.info_label = ttk.Label(options_frame, text="", font=("Arial", 9), foreground="blue")
-        self.info_label.grid(row=3, column=0, sticky=tk.W, pady=(10, 0))
+        self.info_label.grid(row=5, column=0, sticky=tk.W, pady=(10, 0))
         
         # Buttons frame
         button_frame = ttk.Frame(main_frame)
@@ -136,9 +770,25 @@ class FileTraverserGUI:
                                       command=self.start_copy, style="Accent.TButton")
         self.start_button.grid(row=0, column=0, padx=10)
         
-        ttk.Button(button_frame, text="🗑️ Clear Log", command=self.clear_log).grid(row=0, column=1, padx=10)
+        self.stop_button = ttk.Button(button_frame, text="⏹️ Stop Watching", 
+                                     command=self.stop_watch, state='disabled')
+        self.stop_button.grid(row=0, column=1, padx=10)
+        
+        self.retry_button = ttk.Button(button_frame, text="🔁 Retry Failed", 
+                                      command=self.start_retry)
+        self.retry_button.grid(row=0, column=2, padx=10)
+        
+        ttk.Button(button_frame, text="🗑️ Clear Log", command=self.clear_log).grid(row=0, column=3, padx=10)
         
-        ttk.Button(button_frame, text="❓ Help", command=self.show_help).grid(row=0, column=2, padx=10)
+        ttk.Button(button_frame, text="❓ Help", command=self.show_help).grid(row=0, column=4, padx=10)
+        
+        self.plan_button = ttk.Button(button_frame, text="📝 Plan (Dry Run)", 
+                                     command=self.start_plan)
+        self.plan_button.grid(row=1, column=0, columnspan=2, padx=10, pady=(10, 0))
+        
+        self.run_plan_button = ttk.Button(button_frame, text="▶️ Run Plan", 
+                                         command=self.start_run_plan)
+        self.run_plan_button.grid(row=1, column=2, columnspan=2, padx=10, pady=(10, 0))
         
         # Current file display
         current_file_frame = ttk.LabelFrame(main_frame, text="📄 Current File", padding="10")
@@ -192,10 +842,21 @@ class FileTraverserGUI:
         else:
             info = "All files will be copied to the destination folder (flattened). Existing files will be skipped."
         
+        if self.walk_cache.get():
+            if preserve and not overwrite:
+                info += "\nFolders that have not changed since the last run will be skipped without being scanned."
+            else:
+                info += "\nSkipping unchanged folders only works when preserving structure without overwriting."
+        
+        if self.watch_mode.get():
+            info += "\nAfter the first pass, new and modified files will keep being copied until you click Stop Watching."
+        
         self.info_label.config(text=info)
     
     def browse_source(self):
         """Browse for source folder."""
+        from tkinter import filedialog
+        
         folder = filedialog.askdirectory(title="Select Source Folder to Traverse")
         if folder:
             self.source_var.set(folder)
@@ -204,6 +865,8 @@ class FileTraverserGUI:
     
     def browse_dest(self):
         """Browse for destination folder."""
+        from tkinter import filedialog
+        
         folder = filedialog.askdirectory(title="Select Destination Folder")
         if folder:
             self.dest_var.set(folder)
@@ -220,6 +883,8 @@ class FileTraverserGUI:
         """Update the current file display."""
         if status == "Processing":
             display_text = f"📄 {status}: {filename}"
+        elif status == "Copying":
+            display_text = f"📥 {status}: {filename}"
         elif status == "Copied":
             display_text = f"✅ {status}: {filename}"
         elif status == "Skipped":
@@ -239,9 +904,13 @@ class FileTraverserGUI:
         self.copied_files = 0
         self.skipped_files = 0
         self.errors = 0
+        self.failures = []
+        self.last_report = None
     
     def show_help(self):
         """Show help dialog."""
+        from tkinter import messagebox
+        
         help_text = """File Traverser Help
 
 This tool copies all files from a source folder (including all subfolders) to a destination folder.
@@ -263,12 +932,26 @@ EXAMPLES:
 • Replace existing files: Check "Overwrite existing files"
 
 The tool will automatically handle file naming conflicts by adding numbers (file_1.txt, file_2.txt, etc.) when not overwriting.
+
+SKIP UNCHANGED FOLDERS:
+When preserving structure without overwriting, "Skip unchanged folders on repeat runs" remembers the modification time of each folder and of its copy (in ".filevex" in the destination). On the next run, folders that have not changed on either side are skipped without being scanned; files deleted from the destination are copied again.
+
+DRY RUN:
+"Plan (Dry Run)" works out what "Start Copying" would do with the current options - which files would be copied, replaced, renamed with _N suffixes or skipped, and how many bytes that is - without copying anything. The plan is saved to a file; "Run Plan" later copies exactly those files without scanning the source folder again. If a destination name was taken in the meantime, flattened files get the next free _N name (noted in the log).
+
+WATCH MODE:
+Check "Keep watching for changes after copying" to keep the destination mirrored. After the first full copy, new and modified files are copied automatically (in small batches once changes settle down) until you click "Stop Watching". Outside Linux, changes to existing files can take up to a minute to be picked up.
+
+FAILED FILES:
+Busy or temporarily unreachable files are retried automatically with increasing delays. Files that still fail are listed in "filevex_failures.json" in the destination folder. Click "Retry Failed" and pick that report to copy only those files again.
 """
         
         messagebox.showinfo("Help", help_text)
     
     def validate_inputs(self):
         """Validate user inputs."""
+        from tkinter import messagebox
+        
         source = self.source_var.get().strip()
         dest = self.dest_var.get().strip()
         
@@ -292,24 +975,118 @@ The tool will automatically handle file naming conflicts by adding numbers (file
     
     def start_copy(self):
         """Start the copy operation."""
+        import threading
+        
         if not self.validate_inputs():
             return
         
         # Disable start button and start progress
-        self.start_button.config(state='disabled')
+        self.set_job_buttons('disabled')
         self.progress.start()
         self.status_var.set("Copying files...")
         
+        self.stop_watching = threading.Event()
+        if self.watch_mode.get():
+            self.stop_button.config(state='normal')
+        
         # Start copying in a separate thread
         thread = threading.Thread(target=self.copy_files)
         thread.daemon = True
         thread.start()
     
+    def start_retry(self):
+        """Start a job that copies only the files listed in a failure report."""
+        import threading
+        from tkinter import filedialog
+        
+        dest = self.dest_var.get().strip()
+        report_path = filedialog.askopenfilename(
+            title="Select Failure Report",
+            initialdir=dest if dest and os.path.isdir(dest) else None,
+            initialfile=FAILURE_REPORT_NAME,
+            filetypes=[("Failure report", "*.json"), ("All files", "*.*")])
+        if not report_path:
+            return
+        
+        self.set_job_buttons('disabled')
+        self.progress.start()
+        self.status_var.set("Retrying failed files...")
+        
+        thread = threading.Thread(target=self.retry_files, args=(report_path,))
+        thread.daemon = True
+        thread.start()
+    
+    def set_job_buttons(self, state):
+        """Enable or disable the buttons that start a job."""
+        for button in (self.start_button, self.retry_button, self.plan_button, self.run_plan_button):
+            button.config(state=state)
+    
+    def start_plan(self):
+        """Start a dry run that writes a copy plan instead of copying."""
+        import threading
+        from tkinter import filedialog
+        
+        if not self.validate_inputs():
+            return
+        
+        dest = self.dest_var.get().strip()
+        plan_path = filedialog.asksaveasfilename(
+            title="Save Copy Plan",
+            initialdir=dest if os.path.isdir(dest) else None,
+            initialfile=PLAN_FILE_NAME,
+            defaultextension=".json",
+            filetypes=[("Copy plan", "*.json"), ("All files", "*.*")])
+        if not plan_path:
+            return
+        
+        self.set_job_buttons('disabled')
+        self.progress.start()
+        self.status_var.set("Planning...")
+        
+        thread = threading.Thread(target=self.plan_files, args=(plan_path,))
+        thread.daemon = True
+        thread.start()
+    
+    def start_run_plan(self):
+        """Start a job that executes a previously saved copy plan."""
+        import threading
+        from tkinter import filedialog
+        
+        dest = self.dest_var.get().strip()
+        plan_path = filedialog.askopenfilename(
+            title="Select Copy Plan",
+            initialdir=dest if dest and os.path.isdir(dest) else None,
+            initialfile=PLAN_FILE_NAME,
+            filetypes=[("Copy plan", "*.json"), ("All files", "*.*")])
+        if not plan_path:
+            return
+        
+        self.set_job_buttons('disabled')
+        self.progress.start()
+        self.status_var.set("Running plan...")
+        
+        thread = threading.Thread(target=self.run_plan_files, args=(plan_path,))
+        thread.daemon = True
+        thread.start()
+    
+    def stop_watch(self):
+        """Ask a running watch to finish its current batch and stop."""
+        self.stop_watching.set()
+        self.stop_button.config(state='disabled')
+        self.status_var.set("Stopping watch...")
+    
     def copy_files(self):
         """Copy files (runs in separate thread)."""
+        from tkinter import messagebox
+        
+        watcher = None
         try:
             source = self.source_var.get().strip()
             dest = self.dest_var.get().strip()
+            watch = self.watch_mode.get()
+            
+            # Each job starts with a fresh map, filled only when watching
+            self.mirror_map = {} if watch else None
             
             self.log("=" * 60)
             self.log("🚀 Starting file traversal and copy operation...")
@@ -318,117 +1095,800 @@ The tool will automatically handle file naming conflicts by adding numbers (file
             self.log(f"📂 Preserve structure: {self.preserve_structure.get()}")
             self.log(f"🔄 Overwrite: {self.overwrite.get()}")
             self.log(f"📝 Verbose: {self.verbose.get()}")
+            self.log(f"⚡ Skip unchanged folders: {self.walk_cache.get()}")
             self.log("-" * 60)
             
+            snapshot = None
+            if watch:
+                # Start watching before the full pass so changes made while it
+                # runs, in folders it has already visited, are not missed
+                watcher = create_watcher(source)
+                if isinstance(watcher, PollingWatcher):
+                    # The pass records what it lists, so polling needs no scan of its own
+                    snapshot = {}
+            
             # Call the file traverser function
             self.traverse_and_copy_files(
                 source_dir=source,
                 dest_dir=dest,
                 preserve_structure=self.preserve_structure.get(),
                 overwrite=self.overwrite.get(),
-                verbose=self.verbose.get()
+                verbose=self.verbose.get(),
+                use_walk_cache=self.walk_cache.get(),
+                snapshot=snapshot
             )
+            if snapshot is not None:
+                watcher.prime(snapshot)
             
             self.log("-" * 60)
             self.log("✅ Copy operation completed successfully!")
             self.log(f"📊 Summary: {self.copied_files} copied, {self.skipped_files} skipped, {self.errors} errors")
+            self.log_failure_summary()
             self.log("=" * 60)
             
+            if watch and not self.stop_watching.is_set():
+                self.watch_and_mirror(
+                    watcher,
+                    source_dir=source,
+                    dest_dir=dest,
+                    preserve_structure=self.preserve_structure.get(),
+                    overwrite=self.overwrite.get(),
+                    verbose=self.verbose.get()
+                )
+                self.log(f"📊 Summary: {self.copied_files} copied, {self.skipped_files} skipped, {self.errors} errors")
+                self.log_failure_summary()
+                self.log("=" * 60)
+            
             # Show completion message
             self.root.after(0, lambda: messagebox.showinfo("Success", 
                 f"Copy operation completed!\n\n"
                 f"Files copied: {self.copied_files}\n"
                 f"Files skipped: {self.skipped_files}\n"
-                f"Errors: {self.errors}"))
+                f"Errors: {self.errors}" + self.report_message()))
             
         except Exception as e:
             self.log(f"❌ Error: {e}")
-            self.root.after(0, lambda: messagebox.showerror("Error", f"Copy operation failed: {e}"))
+            self.root.after(0, lambda e=e: messagebox.showerror("Error", f"Copy operation failed: {e}"))
         
         finally:
+            if watcher is not None:
+                watcher.close()
+            self.mirror_map = None
+            
             # Re-enable start button and stop progress
             self.root.after(0, self.copy_completed)
     
+    def retry_files(self, report_path):
+        """Copy only the files listed in a failure report (runs in separate thread)."""
+        from tkinter import messagebox
+        
+        self.mirror_map = None
+        
+        try:
+            self.log("=" * 60)
+            self.log("🔁 Retrying failed files...")
+            self.log(f"📋 Report: {report_path}")
+            self.log("-" * 60)
+            
+            self.retry_failed_files(report_path, verbose=self.verbose.get())
+            
+            self.log("-" * 60)
+            self.log("✅ Retry operation completed!")
+            self.log(f"📊 Summary: {self.copied_files} copied, {self.errors} errors")
+            self.log_failure_summary()
+            self.log("=" * 60)
+            
+            self.root.after(0, lambda: messagebox.showinfo("Success", 
+                f"Retry operation completed!\n\n"
+                f"Files copied: {self.copied_files}\n"
+                f"Errors: {self.errors}" + self.report_message()))
+            
+        except Exception as e:
+            self.log(f"❌ Error: {e}")
+            self.root.after(0, lambda e=e: messagebox.showerror("Error", f"Retry operation failed: {e}"))
+        
+        finally:
+            self.root.after(0, self.copy_completed)
+    
+    def plan_files(self, plan_path):
+        """Compute and save a copy plan (runs in separate thread)."""
+        import json
+        from tkinter import messagebox
+        
+        try:
+            source = self.source_var.get().strip()
+            dest = self.dest_var.get().strip()
+            
+            self.log("=" * 60)
+            self.log("📝 Planning copy operation (dry run, nothing is copied)...")
+            self.log(f"📁 Source: {source}")
+            self.log(f"📂 Destination: {dest}")
+            self.log("-" * 60)
+            
+            plan = self.plan_copy(
+                source_dir=source,
+                dest_dir=dest,
+                preserve_structure=self.preserve_structure.get(),
+                overwrite=self.overwrite.get(),
+                use_walk_cache=self.walk_cache.get()
+            )
+            with open(plan_path, "w", encoding="utf-8") as f:
+                json.dump(plan, f, indent=1)
+            
+            summary = self.plan_summary(plan)
+            self.log(summary)
+            self.log(f"📋 Plan saved to: {plan_path}")
+            self.log("=" * 60)
+            
+            self.root.after(0, lambda: messagebox.showinfo("Plan Ready", 
+                f"{summary}\n\nPlan saved to:\n{plan_path}"))
+            
+        except Exception as e:
+            self.log(f"❌ Error: {e}")
+            self.root.after(0, lambda e=e: messagebox.showerror("Error", f"Planning failed: {e}"))
+        
+        finally:
+            self.root.after(0, self.copy_completed)
+    
+    def run_plan_files(self, plan_path):
+        """Execute a saved copy plan (runs in separate thread)."""
+        from tkinter import messagebox
+        
+        self.mirror_map = None
+        
+        try:
+            self.log("=" * 60)
+            self.log("▶️ Running copy plan...")
+            self.log(f"📋 Plan: {plan_path}")
+            self.log("-" * 60)
+            
+            self.execute_plan(plan_path, verbose=self.verbose.get())
+            
+            self.log("-" * 60)
+            self.log("✅ Plan completed!")
+            self.log(f"📊 Summary: {self.copied_files} copied, {self.skipped_files} skipped, {self.errors} errors")
+            self.log_failure_summary()
+            self.log("=" * 60)
+            
+            self.root.after(0, lambda: messagebox.showinfo("Success", 
+                f"Plan completed!\n\n"
+                f"Files copied: {self.copied_files}\n"
+                f"Files skipped: {self.skipped_files}\n"
+                f"Errors: {self.errors}" + self.report_message()))
+            
+        except Exception as e:
+            self.log(f"❌ Error: {e}")
+            self.root.after(0, lambda e=e: messagebox.showerror("Error", f"Running the plan failed: {e}"))
+        
+        finally:
+            self.root.after(0, self.copy_completed)
+    
+    def plan_summary(self, plan):
+        """Describe a plan's totals in one line."""
+        totals = plan["summary"]
+        return (f"📝 Plan: {totals['copy']} to copy, {totals['overwrite']} to overwrite, "
+                f"{totals['rename']} renamed (_N), {totals['skip']} skipped - "
+                f"{format_size(totals['bytes'])} to write")
+    
     def copy_completed(self):
         """Called when copy operation is completed."""
-        self.start_button.config(state='normal')
+        self.set_job_buttons('normal')
+        self.stop_button.config(state='disabled')
         self.progress.stop()
         self.status_var.set("Ready")
     
-    def traverse_and_copy_files(self, source_dir, dest_dir, preserve_structure=False, overwrite=False, verbose=False):
-        """Traverse source directory and copy all files to destination directory."""
+    def log_failure_summary(self):
+        """Log failures grouped by error type instead of one line per file."""
+        if not self.failures:
+            return
+        
+        groups = Counter((f["error_type"], f["category"]) for f in self.failures)
+        self.log(f"⚠️  {len(self.failures)} files could not be copied:")
+        for (error_type, category), count in groups.most_common():
+            self.log(f"   • {error_type} ({category}): {count}")
+        if self.last_report:
+            self.log(f"📋 Failure report: {self.last_report}")
+    
+    def report_message(self):
+        """Extra completion-dialog text pointing at the failure report."""
+        if not self.last_report:
+            return ""
+        return f"\n\nFailure report:\n{self.last_report}"
+    
+    def traverse_and_copy_files(self, source_dir, dest_dir, preserve_structure=False, overwrite=False, verbose=False,
+                                use_walk_cache=False, snapshot=None):
+        """Traverse source directory and copy all files to destination directory.
+        
+        With use_walk_cache, folders whose mtime (and that of their
+        destination folder) is unchanged since the last run are skipped
+        without being listed. The cache is only used when
+        preserving structure without overwriting, where an unchanged folder
+        is guaranteed to only contain files that would be skipped anyway.
+        
+        Pass a dict as snapshot to have every folder recorded in it as
+        scan_tree(stat_files=True) would, for PollingWatcher.prime; folders
+        skipped via the cache are recorded with files set to None.
+        """
+        from pathlib import Path
+        
         source_path = Path(source_dir)
         dest_path = Path(dest_dir)
         
         # Create destination directory if it doesn't exist
         dest_path.mkdir(parents=True, exist_ok=True)
         
+        self.failures = []
+        retry_queue = RetryQueue()
+        
+        use_walk_cache = use_walk_cache and preserve_structure and not overwrite
+        cache_key = walk_cache_key(source_path, dest_path, preserve_structure, overwrite)
+        cache = load_walk_cache(dest_path, cache_key) if use_walk_cache else {}
+        new_cache = {}
+        
         # Walk through all files in source directory
-        for root, dirs, files in os.walk(source_path):
+        for root, files, entry in walk_source(source_path, dest_path, cache, snapshot is not None):
             root_path = Path(root)
+            new_cache[root] = entry
+            if snapshot is not None:
+                snapshot[root] = {"mtime": entry["mtime"], "dirs": entry["dirs"], "files": files}
+            
+            if files is None:
+                if verbose:
+                    self.log(f"⚡ Skipped unchanged folder: {root}")
+                self.skipped_files += entry["files"]
+                continue
             
             for file in files:
                 source_file = root_path / file
                 
+                # Give deferred retries whose backoff has elapsed a turn
+                self.run_due_retries(retry_queue, verbose)
+                
                 # Update current file display
                 self.root.after(0, lambda f=file: self.update_current_file(f, "Processing"))
                 
-                if preserve_structure:
-                    # Calculate relative path from source directory
-                    relative_path = source_file.relative_to(source_path)
-                    dest_file = dest_path / relative_path
-                    
-                    # Create subdirectories if needed
-                    dest_file.parent.mkdir(parents=True, exist_ok=True)
-                else:
-                    # Flatten structure - all files go directly to destination
-                    dest_file = dest_path / file
-                    
-                    # Handle naming conflicts by adding a number suffix
-                    if not overwrite and dest_file.exists():
-                        counter = 1
-                        name_parts = file.rsplit('.', 1)
-                        if len(name_parts) == 2:
-                            base_name, extension = name_parts
-                            new_name = f"{base_name}_{counter}.{extension}"
-                        else:
-                            new_name = f"{file}_{counter}"
-                        
-                        dest_file = dest_path / new_name
-                        
-                        # Keep incrementing until we find a unique name
-                        while dest_file.exists():
-                            counter += 1
-                            if len(name_parts) == 2:
-                                new_name = f"{base_name}_{counter}.{extension}"
-                            else:
-                                new_name = f"{file}_{counter}"
-                            dest_file = dest_path / new_name
-                
+                dest_file = None
                 try:
+                    dest_file = self.resolve_dest_file(source_file, source_path, dest_path,
+                                                       preserve_structure, overwrite)
+                    
                     # Check if destination file exists and handle accordingly
                     if dest_file.exists() and not overwrite:
                         self.root.after(0, lambda f=file: self.update_current_file(f, "Skipped"))
                         if verbose:
                             self.log(f"⏭️  Skipped (exists): {source_file.name}")
                         self.skipped_files += 1
+                        self.remember_mirror(source_file, dest_file)
                         continue
                     
-                    # Copy the file
-                    shutil.copy2(source_file, dest_file)
-                    
-                    # Update current file display to show completion
-                    self.root.after(0, lambda f=file: self.update_current_file(f, "Copied"))
-                    
-                    if verbose:
-                        self.log(f"✅ Copied: {source_file.name}")
-                    
-                    self.copied_files += 1
+                    # Copy the file (with the size from the listing when it was stat'ed)
+                    size = files[file][1] if snapshot is not None and files[file] else None
+                    self.copy_file(source_file, dest_file, verbose, size)
                     
                 except Exception as e:
-                    self.root.after(0, lambda f=file: self.update_current_file(f, "Error"))
-                    self.log(f"❌ Error copying {source_file.name}: {e}")
-                    self.errors += 1
+                    # Without a destination yet, the retry has to work it out again
+                    resolve = None
+                    if dest_file is None:
+                        resolve = functools.partial(self.resolve_pending_dest, source_file, source_path,
+                                                    dest_path, preserve_structure, overwrite)
+                    self.handle_copy_error(source_file, dest_file, e, 1, retry_queue, verbose, resolve)
+        
+        # Finish any retries still waiting out their backoff
+        self.drain_retry_queue(retry_queue, verbose)
+        
+        self.write_failure_report(dest_path, {
+            "source_dir": str(source_path),
+            "dest_dir": str(dest_path),
+            "preserve_structure": preserve_structure,
+            "overwrite": overwrite,
+        })
+        
+        # Saved last, so the destination mtimes it records include the report
+        if use_walk_cache:
+            # Folders with failed files have to be listed again next time
+            for failure in self.failures:
+                entry = new_cache.get(os.path.dirname(failure["source"]))
+                if entry is not None:
+                    entry["complete"] = False
+            save_walk_cache(source_path, dest_path, cache_key, new_cache)
+    
+    def resolve_dest_file(self, source_file, source_path, dest_path, preserve_structure=False, overwrite=False,
+                          destination=None):
+        """Work out where a source file should be copied to.
+        
+        For dry runs, pass a DestinationModel as destination: existence checks
+        then go to the model and no folders are created. Names reserved by
+        pending retries count as taken.
+        """
+        if destination is not None:
+            exists = destination.exists
+        else:
+            exists = lambda path: path in self.reserved_dests or os.path.exists(path)
+        
+        if preserve_structure:
+            # Calculate relative path from source directory
+            relative_path = source_file.relative_to(source_path)
+            dest_file = dest_path / relative_path
+        
+            # Create subdirectories if needed
+            if destination is None:
+                dest_file.parent.mkdir(parents=True, exist_ok=True)
+        else:
+            # Flatten structure - all files go directly to destination
+            dest_file = dest_path / source_file.name
+        
+            # Handle naming conflicts by adding a number suffix
+            if not overwrite and exists(dest_file):
+                counter = 1
+                name_parts = source_file.name.rsplit('.', 1)
+                if len(name_parts) == 2:
+                    base_name, extension = name_parts
+                    new_name = f"{base_name}_{counter}.{extension}"
+                else:
+                    new_name = f"{source_file.name}_{counter}"
+        
+                dest_file = dest_path / new_name
+        
+                # Keep incrementing until we find a unique name
+                while exists(dest_file):
+                    counter += 1
+                    if len(name_parts) == 2:
+                        new_name = f"{base_name}_{counter}.{extension}"
+                    else:
+                        new_name = f"{source_file.name}_{counter}"
+                    dest_file = dest_path / new_name
+        
+        return dest_file
+    
+    def watch_and_mirror(self, watcher, source_dir, dest_dir, preserve_structure=False, overwrite=False,
+                         verbose=False):
+        """Keep copying created and modified files until Stop Watching is clicked.
+        
+        watcher comes from create_watcher and is owned by the caller, which
+        creates it before the initial full pass. Change events are collected
+        until the source has been quiet for WATCH_DEBOUNCE seconds (or
+        WATCH_BATCH_SIZE changes are pending) and then copied as one batch.
+        """
+        from pathlib import Path
+        
+        source_path = Path(source_dir)
+        dest_path = Path(dest_dir)
+        
+        kind = "inotify" if isinstance(watcher, InotifyWatcher) else "polling"
+        self.log(f"👁️ Watching {source_path} for changes ({kind})...")
+        self.root.after(0, lambda: self.status_var.set("Watching for changes..."))
+        
+        pending = set()
+        last_change = time.monotonic()
+        while not self.stop_watching.is_set():
+            changed = watcher.poll(WATCH_TICK)
+            if changed:
+                pending |= changed
+                last_change = time.monotonic()
+            
+            quiet = time.monotonic() - last_change >= WATCH_DEBOUNCE
+            if pending and (quiet or len(pending) >= WATCH_BATCH_SIZE):
+                self.mirror_changes(pending, source_path, dest_path, preserve_structure, overwrite, verbose)
+                pending = set()
+        
+        if pending:
+            self.mirror_changes(pending, source_path, dest_path, preserve_structure, overwrite, verbose)
+        
+        self.log("⏹️ Stopped watching for changes")
+    
+    def mirror_changes(self, paths, source_path, dest_path, preserve_structure=False, overwrite=False, verbose=False):
+        """Copy a batch of created or modified source files to the destination."""
+        from pathlib import Path
+        
+        batch = {str(path) for path in paths}
+        self.failures = [f for f in self.failures if f["source"] not in batch]
+        retry_queue = RetryQueue()
+        copied_before = self.copied_files
+        
+        for path in sorted(batch):
+            source_file = Path(path)
+            
+            # Ignore files that vanished since the event, and our own output
+            if not source_file.is_file() or dest_path in source_file.parents:
+                continue
+            
+            self.run_due_retries(retry_queue, verbose)
+            self.root.after(0, lambda f=source_file.name: self.update_current_file(f, "Processing"))
+            
+            dest_file = self.mirror_map.get(path)
+            if dest_file is not None and dest_path not in dest_file.parents:
+                dest_file = None
+            
+            try:
+                if dest_file is None and preserve_structure:
+                    # With the structure preserved a file's destination is fixed,
+                    # so an existing one is its mirror even if this job never
+                    # touched it (e.g. its folder was skipped via the walk cache)
+                    candidate = dest_path / source_file.relative_to(source_path)
+                    if candidate.exists():
+                        dest_file = candidate
+                
+                if dest_file is not None:
+                    # Already mirrored: refresh it only if the source changed
+                    if self.is_up_to_date(source_file, dest_file):
+                        self.remember_mirror(source_file, dest_file)
+                        continue
+                else:
+                    dest_file = self.resolve_dest_file(source_file, source_path, dest_path,
+                                                       preserve_structure, overwrite)
+                
+                self.copy_file(source_file, dest_file, verbose)
+                
+            except Exception as e:
+                # If the destination could not be resolved, the retry works it out again
+                resolve = None
+                if dest_file is None:
+                    resolve = functools.partial(self.resolve_pending_dest, source_file, source_path,
+                                                dest_path, preserve_structure, overwrite)
+                self.handle_copy_error(source_file, dest_file, e, 1, retry_queue, verbose, resolve)
+        
+        self.drain_retry_queue(retry_queue, verbose)
+        
+        copied = self.copied_files - copied_before
+        if copied:
+            self.log(f"🔄 Mirrored {copied} changed files")
+        
+        self.write_failure_report(dest_path, {
+            "source_dir": str(source_path),
+            "dest_dir": str(dest_path),
+            "preserve_structure": preserve_structure,
+            "overwrite": overwrite,
+        })
+        self.root.after(0, lambda: self.status_var.set("Watching for changes..."))
+    
+    def is_up_to_date(self, source_file, dest_file):
+        """Check whether a mirrored copy still matches its source file."""
+        try:
+            src = source_file.stat()
+            dst = dest_file.stat()
+        except OSError:
+            return False
+        # copy2 carries the mtime over, so any difference means the source changed
+        return src.st_size == dst.st_size and src.st_mtime_ns == dst.st_mtime_ns
+    
+    def copy_file(self, source_file, dest_file, verbose=False, size=None):
+        """Copy a single file and record it as copied.
+        
+        Files of LARGE_FILE_THRESHOLD bytes or more are copied in parallel
+        chunks (where the OS supports positional I/O) with per-chunk progress;
+        everything else goes through shutil.copy2. Pass size when the caller
+        already knows it, to save a stat() of the source.
+        """
+        import shutil
+        
+        if hasattr(os, "pwrite") and size is None:
+            st = os.stat(source_file)
+            # Special files (FIFOs, devices) go to copy2, which rejects them
+            size = st.st_size if stat.S_ISREG(st.st_mode) else 0
+        
+        if hasattr(os, "pwrite") and size >= LARGE_FILE_THRESHOLD:
+            self.copy_large(source_file, dest_file)
+        else:
+            shutil.copy2(source_file, dest_file)
+        self.remember_mirror(source_file, dest_file)
+        
+        # Update current file display to show completion
+        self.root.after(0, lambda f=source_file.name: self.update_current_file(f, "Copied"))
+        
+        if verbose:
+            self.log(f"✅ Copied: {source_file.name}")
+        
+        self.copied_files += 1
+    
+    def copy_large(self, source_file, dest_file):
+        """Copy a large file with copy_large_file, showing its progress."""
+        import shutil
+        
+        # The size may come from a listing, so check the file itself again
+        # before opening it (opening a FIFO would block)
+        if not stat.S_ISREG(os.stat(source_file).st_mode):
+            raise shutil.SpecialFileError(f"`{source_file}` is not a regular file")
+        if os.path.exists(dest_file) and os.path.samefile(source_file, dest_file):
+            raise shutil.SameFileError(f"{source_file!r} and {dest_file!r} are the same file")
+        
+        def progress(done, total, name=source_file.name):
+            text = f"{name} ({done * 100 // max(total, 1)}%)"
+            self.root.after(0, lambda: self.update_current_file(text, "Copying"))
+        
+        with open(source_file, "rb") as fsrc:
+            copy_large_file(fsrc.fileno(), source_file, dest_file, progress)
+    
+    def resolve_pending_dest(self, source_file, source_path, dest_path, preserve_structure=False, overwrite=False):
+        """Resolve the destination of a file that failed before it had one.
+        
+        Returns None when the file should be skipped because it already exists.
+        """
+        dest_file = self.resolve_dest_file(source_file, source_path, dest_path, preserve_structure, overwrite)
+        if dest_file.exists() and not overwrite:
+            return None
+        return dest_file
+    
+    def remember_mirror(self, source_file, dest_file):
+        """Record where a source file was mirrored to, while a watch job runs."""
+        if self.mirror_map is not None:
+            self.mirror_map[str(source_file)] = dest_file
+    
+    def handle_copy_error(self, source_file, dest_file, error, attempts, retry_queue, verbose=False, resolve=None):
+        """Defer a transient failure for retry, or record it as a final failure.
+        
+        dest_file is None when the destination could not be worked out; resolve
+        is then called on retry to work it out (see resolve_pending_dest).
+        """
+        category = classify_error(error)
+        
+        if category == "transient" and attempts < MAX_COPY_ATTEMPTS:
+            if dest_file is not None:
+                self.reserved_dests.add(dest_file)
+            delay = retry_delay(attempts)
+            retry_queue.push({"source": source_file, "dest": dest_file, "attempts": attempts,
+                              "resolve": resolve}, delay)
+            if verbose:
+                self.log(f"🔁 Will retry {source_file.name} in {delay:.1f}s "
+                         f"(attempt {attempts}/{MAX_COPY_ATTEMPTS}): {error}")
+            return
+        
+        self.root.after(0, lambda f=source_file.name: self.update_current_file(f, "Error"))
+        if verbose:
+            self.log(f"❌ Error copying {source_file.name}: {error}")
+        
+        self.failures.append({
+            "source": str(source_file),
+            "dest": str(dest_file) if dest_file is not None else None,
+            "error": str(error),
+            "error_type": type(error).__name__,
+            "errno": getattr(error, "errno", None),
+            "category": category,
+            "attempts": attempts,
+        })
+        self.errors += 1
+    
+    def run_due_retries(self, retry_queue, verbose=False):
+        """Retry every deferred copy whose backoff has elapsed, without waiting."""
+        for item in retry_queue.pop_due():
+            source_file = item["source"]
+            dest_file = item["dest"]
+            attempts = item["attempts"] + 1
+            self.reserved_dests.discard(dest_file)
+            try:
+                if dest_file is None:
+                    dest_file = item["resolve"]()
+                    if dest_file is None:
+                        if verbose:
+                            self.log(f"⏭️  Skipped (exists): {source_file.name}")
+                        self.skipped_files += 1
+                        continue
+                
+                # The name stayed reserved while the retry waited, so a file
+                # there can only be a partial one left by the failed attempt
+                self.copy_file(source_file, dest_file, verbose)
+            except Exception as e:
+                self.handle_copy_error(source_file, dest_file, e, attempts, retry_queue, verbose, item["resolve"])
+    
+    def drain_retry_queue(self, retry_queue, verbose=False):
+        """Block until every deferred copy has succeeded or run out of attempts."""
+        while len(retry_queue):
+            self.root.after(0, lambda n=len(retry_queue): self.status_var.set(f"Retrying {n} files..."))
+            time.sleep(retry_queue.seconds_until_next())
+            self.run_due_retries(retry_queue, verbose)
+    
+    def write_failure_report(self, dest_path, job):
+        """Write the failures of the last job to the destination folder as JSON.
+        
+        The report doubles as the input of a "retry only failed files" job. A
+        stale report is removed when a job finishes without failures.
+        """
+        import json
+        from datetime import datetime
+        from pathlib import Path
+        
+        report_path = Path(dest_path) / FAILURE_REPORT_NAME
+        self.last_report = None
+        
+        if not self.failures:
+            if report_path.exists():
+                report_path.unlink()
+            return None
+        
+        report = {
+            "version": 1,
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "job": job,
+            "failures": self.failures,
+        }
+        report_path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        self.last_report = report_path
+        return report_path
+    
+    def retry_failed_files(self, report_path, verbose=False):
+        """Copy only the files listed in a failure report, then rewrite the report."""
+        import json
+        from pathlib import Path
+        
+        report = json.loads(Path(report_path).read_text(encoding="utf-8"))
+        entries = report.get("failures", [])
+        
+        job = report.get("job", {})
+        
+        self.failures = []
+        retry_queue = RetryQueue()
+        
+        for entry in entries:
+            source_file = Path(entry["source"])
+            dest_file = Path(entry["dest"]) if entry.get("dest") else None
+            
+            # Files that failed before getting a destination are resolved again
+            resolve = None
+            if dest_file is None:
+                resolve = functools.partial(self.resolve_pending_dest, source_file, Path(job["source_dir"]),
+                                            Path(job["dest_dir"]), job.get("preserve_structure", False),
+                                            job.get("overwrite", False))
+            
+            self.run_due_retries(retry_queue, verbose)
+            self.root.after(0, lambda f=source_file.name: self.update_current_file(f, "Processing"))
+            
+            try:
+                if dest_file is None:
+                    dest_file = resolve()
+                    if dest_file is None:
+                        if verbose:
+                            self.log(f"⏭️  Skipped (exists): {source_file.name}")
+                        self.skipped_files += 1
+                        continue
+                elif (not job.get("preserve_structure", False) and not job.get("overwrite", False)
+                      and dest_file.exists()):
+                    # The flattened name may have gone to another file since the
+                    # failure: pick a free name again instead of replacing it
+                    dest_file = self.resolve_dest_file(source_file, Path(job["source_dir"]),
+                                                       Path(job["dest_dir"]))
+                else:
+                    dest_file.parent.mkdir(parents=True, exist_ok=True)
+                self.copy_file(source_file, dest_file, verbose)
+            except Exception as e:
+                self.handle_copy_error(source_file, dest_file, e, 1, retry_queue, verbose, resolve)
+        
+        self.drain_retry_queue(retry_queue, verbose)
+        
+        return self.write_failure_report(Path(report_path).parent, job)
+    
+    def plan_copy(self, source_dir, dest_dir, preserve_structure=False, overwrite=False, use_walk_cache=False):
+        """Work out what traverse_and_copy_files would do, without writing anything.
+        
+        The same destination and collision logic runs against a
+        DestinationModel. Every file gets an action: "copy", "overwrite",
+        "rename" (flattened name collision, gets an _N suffix) or "skip".
+        The returned plan is JSON-serialisable and can be run by execute_plan.
+        """
+        from datetime import datetime
+        from pathlib import Path
+        
+        source_path = Path(source_dir)
+        dest_path = Path(dest_dir)
+        destination = DestinationModel()
+        
+        use_walk_cache = use_walk_cache and preserve_structure and not overwrite
+        cache_key = walk_cache_key(source_path, dest_path, preserve_structure, overwrite)
+        cache = load_walk_cache(dest_path, cache_key) if use_walk_cache else {}
+        
+        entries = []
+        totals = {"copy": 0, "overwrite": 0, "rename": 0, "skip": 0, "bytes": 0}
+        
+        for root, files, entry in walk_source(source_path, dest_path, cache):
+            if files is None:
+                totals["skip"] += entry["files"]
+                continue
+            
+            root_path = Path(root)
+            for file in files:
+                source_file = root_path / file
+                self.root.after(0, lambda f=file: self.update_current_file(f, "Processing"))
+                
+                try:
+                    st = source_file.stat()
+                except OSError as e:
+                    self.log(f"❌ Cannot read {source_file}: {e}")
+                    continue
+                
+                dest_file = self.resolve_dest_file(source_file, source_path, dest_path,
+                                                   preserve_structure, overwrite, destination)
+                
+                if destination.exists(dest_file):
+                    action = "overwrite" if overwrite else "skip"
+                elif dest_file.name != source_file.name:
+                    action = "rename"
+                else:
+                    action = "copy"
+                
+                totals[action] += 1
+                if action != "skip":
+                    totals["bytes"] += st.st_size
+                    destination.add(dest_file)
+                
+                entries.append({
+                    "source": str(source_file),
+                    "dest": str(dest_file),
+                    "action": action,
+                    "size": st.st_size,
+                })
+        
+        return {
+            "version": PLAN_VERSION,
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "job": {
+                "source_dir": str(source_path),
+                "dest_dir": str(dest_path),
+                "preserve_structure": preserve_structure,
+                "overwrite": overwrite,
+            },
+            "summary": totals,
+            "entries": entries,
+        }
+    
+    def execute_plan(self, plan_path, verbose=False):
+        """Copy the files in a saved plan without walking the source again.
+        
+        The source is not stat'ed: the copy path is picked from the planned
+        size. If the plan does not overwrite and a planned destination has
+        appeared since planning, the file is skipped when the structure is
+        preserved; flattened files get the next free _N name, as a real run
+        would, and the rename is logged as a deviation from the plan.
+        """
+        import json
+        from pathlib import Path
+        
+        with open(plan_path, encoding="utf-8") as f:
+            plan = json.load(f)
+        if plan.get("version") != PLAN_VERSION:
+            raise ValueError(f"Unsupported plan version: {plan.get('version')}")
+        
+        job = plan["job"]
+        overwrite = job.get("overwrite", False)
+        preserve_structure = job.get("preserve_structure", False)
+        
+        self.failures = []
+        retry_queue = RetryQueue()
+        created_dirs = set()
+        
+        for entry in plan["entries"]:
+            if entry["action"] == "skip":
+                self.skipped_files += 1
+                continue
+            
+            source_file = Path(entry["source"])
+            dest_file = Path(entry["dest"])
+            
+            self.run_due_retries(retry_queue, verbose)
+            self.root.after(0, lambda f=source_file.name: self.update_current_file(f, "Processing"))
+            
+            try:
+                if dest_file.parent not in created_dirs:
+                    dest_file.parent.mkdir(parents=True, exist_ok=True)
+                    created_dirs.add(dest_file.parent)
+                
+                if not overwrite and dest_file.exists():
+                    if preserve_structure:
+                        self.root.after(0, lambda f=source_file.name: self.update_current_file(f, "Skipped"))
+                        if verbose:
+                            self.log(f"⏭️  Skipped (exists): {source_file.name}")
+                        self.skipped_files += 1
+                        continue
+                    
+                    planned = dest_file
+                    dest_file = self.resolve_dest_file(source_file, Path(job["source_dir"]), Path(job["dest_dir"]))
+                    self.log(f"↪️ Plan deviation: {planned.name} was taken since planning, "
+                             f"copying {source_file.name} as {dest_file.name}")
+                
+                self.copy_file(source_file, dest_file, verbose, entry.get("size"))
+            except Exception as e:
+                self.handle_copy_error(source_file, dest_file, e, 1, retry_queue, verbose)
+        
+        self.drain_retry_queue(retry_queue, verbose)
+        
+        return self.write_failure_report(Path(job["dest_dir"]), job)
 
 
 
@@ -448,11 +1908,24 @@ def main():
     
     # Handle window closing
     def on_closing():
+        from tkinter import messagebox
+        
         if messagebox.askokcancel("Quit", "Do you want to quit?"):
             root.destroy()
     
     root.protocol("WM_DELETE_WINDOW", on_closing)
     
+    # Startup benchmark hook: note when the first window is drawn, then quit
+    marker = os.environ.get("FILEVEX_STARTUP_MARKER")
+    if marker:
+        def record_first_window():
+            root.update()
+            with open(marker, "w") as f:
+                f.write(repr(time.time()))
+            root.destroy()
+        
+        root.after_idle(record_first_window)
+    
     # Start the GUI
     root.mainloop()
 